@@ -33,6 +33,41 @@ router.get( '/new', async ( req, res ) => {
     }
 } )
 
+/**
+ * Route to generate challenges for many miners in one request
+ * @params {Array} req.body.miner_uids - Miner uids to generate a challenge for, each is used as the challenge tag
+ * @returns {Object} { challenges: [ { miner_uid, challenge, challenge_url } ] } in the order of miner_uids
+ */
+router.post( '/new_bulk', async ( req, res ) => {
+
+    // Allow only localhost to call this route
+    if( !request_is_local( req ) ) return res.status( 403 ).json( { error: `Request not from localhost` } )
+
+    // Get miner uids from the request body
+    const { miner_uids } = req.body || {}
+    if( !Array.isArray( miner_uids ) ) return res.status( 400 ).json( { error: `miner_uids must be an array` } )
+
+    const handle_route = async () => {
+
+        // Generate one challenge per miner uid, tagged the same way as the /new route
+        const challenges = await Promise.all( miner_uids.map( async miner_uid => {
+            const { challenge, challenge_url } = await generate_challenge( { tag: `${ miner_uid }` } )
+            return { miner_uid, challenge, challenge_url }
+        } ) )
+
+        return { challenges }
+
+    }
+
+    try {
+        const retryable_handler = await make_retryable( handle_route, { retry_times, cooldown_in_s } )
+        const response_data = await retryable_handler()
+        return res.json( response_data )
+    } catch ( error ) {
+        return res.status( 500 ).json( { error: `Error handling bulk challenge route: ${ error.message }` } )
+    }
+} )
+
 router.get( "/:challenge", async ( req, res ) => {
 
 
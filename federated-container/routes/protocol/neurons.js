@@ -7,9 +7,34 @@ import { cooldown_in_s, retry_times } from "../../modules/networking/routing.js"
 import { map_ips_to_geodata } from "../../modules/geolocation/ip_mapping.js"
 export const router = Router()
 
+/**
+ * Expands a columnar neuron broadcast into one neuron object per uid
+ * @param {Object} body - Request body with parallel uids, ips, validator_trust, alpha_stake, stake_weight, hotkey, coldkey arrays and scalar block, excluded_uid
+ * @returns {Array} Array of neuron objects in the same shape as req.body.neurons
+ */
+function expand_columnar_neurons( body={} ) {
+
+    const { uids, ips=[], validator_trust=[], alpha_stake=[], stake_weight=[], hotkey=[], coldkey=[], block, excluded_uid } = body
+    if( !Array.isArray( uids ) ) return []
+
+    return uids.map( ( uid, index ) => ( {
+        uid,
+        ip: ips[ index ],
+        validator_trust: validator_trust[ index ],
+        alpha_stake: alpha_stake[ index ],
+        stake_weight: stake_weight[ index ],
+        block,
+        hotkey: hotkey[ index ],
+        coldkey: coldkey[ index ],
+        excluded: uid === excluded_uid
+    } ) )
+
+}
+
 /**
  * Route to handle neuron broadcasts
  * @params {Object} req.body.neurons - Array of neuron objects with properties: uid, ip, validator_trust, alpha_stake, stake_weight, block, hotkey, coldkey
+ * @params {Array} req.body.uids - Alternatively a columnar body, see expand_columnar_neurons
  */
 router.post( "/broadcast/neurons", async ( req, res ) => {
 
@@ -17,8 +42,8 @@ router.post( "/broadcast/neurons", async ( req, res ) => {
 
     const handle_route = async () => {
 
-        // Get neurons from the request
-        const { neurons=[] } = req.body || {}
+        // Get neurons from the request, either as an array of objects or as columns
+        const { neurons=expand_columnar_neurons( req.body ) } = req.body || {}
 
         // Validate that all properties are present
         let valid_entries = neurons.filter( entry => require_props( entry, [ 'uid', 'ip', 'validator_trust', 'alpha_stake', 'stake_weight', 'block', 'hotkey', 'coldkey' ], false ) )
@@ -48,6 +48,27 @@ describe( '/protocol/broadcast/neurons endpoint', () => {
             assert.strictEqual( data.validators, 1 )
         } )
 
+        test( 'should accept columnar neuron data', async () => {
+            const columnar = {
+                uids: validNeurons.map( ( { uid } ) => uid ),
+                ips: validNeurons.map( ( { ip } ) => ip ),
+                validator_trust: validNeurons.map( ( { validator_trust } ) => validator_trust ),
+                alpha_stake: validNeurons.map( ( { alpha_stake } ) => alpha_stake ),
+                stake_weight: validNeurons.map( ( { stake_weight } ) => stake_weight ),
+                hotkey: validNeurons.map( ( { hotkey } ) => hotkey ),
+                coldkey: validNeurons.map( ( { coldkey } ) => coldkey ),
+                block: 12345,
+                excluded_uid: 0
+            }
+            const { response, data } = await json.post( `${ BASE_URL }/protocol/broadcast/neurons`, columnar )
+
+            assert.strictEqual( response.status, 200 )
+            assert.strictEqual( data.success, true )
+            assert.strictEqual( data.validators, 1 )
+            assert.strictEqual( data.miners, 1 )
+            assert.strictEqual( data.weight_copiers, 0 )
+        } )
+
         test( 'should handle empty neurons array gracefully', async () => {
             const { response, data } = await json.post( `${ BASE_URL }/protocol/broadcast/neurons`, { neurons: [] } )
 
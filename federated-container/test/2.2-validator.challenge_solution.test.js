@@ -37,6 +37,27 @@ describe( '/protocol/challenge endpoints', () => {
         assert.ok( data.challenge_url.includes( data.challenge ) )
     } )
 
+    test( 'should create one challenge per miner uid via /new_bulk', async () => {
+        const miner_uids = [ 0, 11, 12 ]
+        const { response, data } = await json.post( `${ BASE_URL }/protocol/challenge/new_bulk`, { miner_uids } )
+
+        assert.strictEqual( response.status, 200 )
+        assert.ok( Array.isArray( data.challenges ) )
+        assert.strictEqual( data.challenges.length, miner_uids.length )
+        data.challenges.forEach( ( { miner_uid, challenge, challenge_url }, index ) => {
+            assert.strictEqual( miner_uid, miner_uids[ index ] )
+            assert.ok( uuidValidate( challenge ), 'challenge must be a valid UUID' )
+            assert.ok( challenge_url.includes( challenge ) )
+        } )
+    } )
+
+    test( 'should reject a /new_bulk body without a miner_uids array', async () => {
+        const { response, data } = await json.post( `${ BASE_URL }/protocol/challenge/new_bulk`, { miner_uids: 'abc' } )
+
+        assert.strictEqual( response.status, 400 )
+        assert.ok( data.error )
+    } )
+
     test( 'should fetch the solution payload for a challenge via /:challenge', async () => {
         const miner_uid = '12345'
         const { data: newData } = await json.get( `${ BASE_URL }/protocol/challenge/new?tag=${ miner_uid }` )
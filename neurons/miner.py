@@ -48,7 +48,7 @@ class UnknownSynapseFilter(logging.Filter):
 # import base miner class which takes care of most of the boilerplate
 from sybil.base.miner import BaseMinerNeuron
 from sybil.base.consts import BURN_UID, BURN_WEIGHT
-from sybil.utils.http import post_json, HTTPClientError, CHALLENGE_TIMEOUT
+from sybil.utils.http import post_json, close_http_client, HTTPClientError, CHALLENGE_TIMEOUT
 
 
 class Miner(BaseMinerNeuron):
@@ -328,7 +328,11 @@ if __name__ == "__main__":
                     await asyncio.sleep(10)
 
         # Run the periodic broadcast in the background
-        loop.run_until_complete(periodic_broadcast())
+        try:
+            loop.run_until_complete(periodic_broadcast())
+        finally:
+            # Release pooled HTTP connections before exiting
+            loop.run_until_complete(close_http_client())
         
         while True:
             bt.logging.info(f"Miner running... {time.time()}")
@@ -19,6 +19,7 @@
 
 
 import time
+import asyncio
 import logging
 import requests
 
@@ -30,6 +31,7 @@ from sybil.base.validator import BaseValidatorNeuron
 
 # Bittensor Validator Template:
 from sybil.validator import forward
+from sybil.utils.http import close_http_client
 
 
 class UnknownSynapseFilter(logging.Filter):
@@ -140,6 +142,10 @@ class Validator(BaseValidatorNeuron):
             bt.logging.error(f"Fatal error during validation: {str(err)}")
             bt.logging.debug("".join(format_exception(type(err), err, err.__traceback__)))
 
+        finally:
+            # Release pooled HTTP connections held on the validator loop
+            self.loop.run_until_complete(close_http_client())
+
 # Health check timeout in seconds
 HEALTH_CHECK_TIMEOUT = 10
 
@@ -164,6 +170,14 @@ MAX_CONSECUTIVE_FAILURES = 3
 
 # The main function parses the configuration and runs the validator.
 if __name__ == "__main__":
+    # Use the libuv based event loop when available, it must be set before the validator creates its loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy( uvloop.EventLoopPolicy() )
+        bt.logging.info( "Using uvloop event loop" )
+    except ImportError:
+        bt.logging.info( "uvloop not installed, using default asyncio event loop" )
+
     # Retry initialization on transient network/subtensor failures
     validator = None
     while validator is None:
@@ -1,11 +1,15 @@
 # Shared HTTP client with timeouts, retries, and connection pooling
 # Prevents indefinite hangs when Node.js container is unresponsive
 
+import time
 import asyncio
+from functools import lru_cache
 import aiohttp
+import orjson
 import bittensor as bt
-from random import uniform
+from random import SystemRandom
 from typing import Optional, Any, Dict
+from urllib.parse import urlsplit
 
 
 # Timeout configuration (in seconds)
@@ -16,9 +20,27 @@ CHALLENGE_TIMEOUT = 60  # Longer for compute-intensive tasks
 # Retry configuration
 MAX_RETRIES = 3
 INITIAL_DELAY = 1.0
-BACKOFF_MULTIPLIER = 2.0
+BACKOFF_MULTIPLIER = 3.0  # Upper bound of the decorrelated jitter window
 MAX_DELAY = 30.0
-JITTER_MAX = 1.0  # Random jitter to prevent thundering herd
+
+# Dedicated RNG so concurrent retries don't share the global random state
+_random = SystemRandom()
+
+# Circuit breaker configuration, opt-in per request and tracked per host
+CB_THRESHOLD = 5  # Consecutive failed requests before the circuit opens
+CB_COOLDOWN = 30.0  # Seconds to fail fast before letting a trial request through
+_breakers: Dict[str, Dict[str, Any]] = {}
+
+# Connection pool configuration, no per host cap since nearly all traffic goes to the one container
+POOL_LIMIT = 100
+DNS_CACHE_TTL = 300
+CLOSE_TIMEOUT = 5  # Seconds to wait for a session on another loop to close
+KEEPALIVE_TIMEOUT = 60
+
+# One pooled session per event loop, sessions cannot be shared across loops
+# (the miner calls these helpers from both its main loop and the axon loop).
+# Entries live until close_http_client, a session keeps its loop alive anyway
+_sessions = {}
 
 
 class HTTPClientError( Exception ):
@@ -26,84 +48,207 @@ class HTTPClientError( Exception ):
     pass
 
 
-def _get_timeout( timeout_seconds: Optional[float] = None ) -> aiohttp.ClientTimeout:
-    """Create aiohttp timeout configuration"""
-    total = timeout_seconds or DEFAULT_TIMEOUT
+@lru_cache( maxsize=16 )
+def _make_timeout( total: float ) -> aiohttp.ClientTimeout:
+    """Build the timeout for a given total once, only a handful of distinct values are used"""
+    # sock_connect rather than connect, so waiting for a free pooled connection is not cut off after CONNECT_TIMEOUT
     return aiohttp.ClientTimeout(
         total=total,
-        connect=CONNECT_TIMEOUT
+        sock_connect=CONNECT_TIMEOUT
     )
 
 
-async def _retry_with_backoff( func, *args, max_retries: int = MAX_RETRIES, **kwargs ):
+def get_timeout( timeout_seconds: Optional[float] = None ) -> aiohttp.ClientTimeout:
+    """Get aiohttp timeout configuration"""
+    return _make_timeout( timeout_seconds or DEFAULT_TIMEOUT )
+
+
+async def get_session() -> aiohttp.ClientSession:
     """
-    Execute async function with exponential backoff retry logic.
-    Raises HTTPClientError after all retries exhausted.
+    Return the shared session for the running event loop, creating it on first use.
+    Reusing the session keeps TCP connections and DNS lookups pooled between requests.
+    The container is a plain HTTP Express server, so keep-alive HTTP/1.1 is used; HTTP/2
+    multiplexing would need TLS or h2c support on the Node side first.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get( loop )
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT
+        )
+        session = aiohttp.ClientSession( connector=connector, timeout=get_timeout() )
+        _sessions[ loop ] = session
+    return session
+
+
+async def close_http_client():
+    """Close the shared sessions, including those opened on other running loops such as the miner's axon loop"""
+    current_loop = asyncio.get_running_loop()
+    for loop, session in list( _sessions.items() ):
+        del _sessions[ loop ]
+        if session.closed:
+            continue
+
+        try:
+            if loop is current_loop:
+                await session.close()
+            elif loop.is_running():
+                # A session must be closed on the loop that owns it
+                future = asyncio.run_coroutine_threadsafe( session.close(), loop )
+                await asyncio.wait_for( asyncio.wrap_future( future ), CLOSE_TIMEOUT )
+        except Exception as e:
+            bt.logging.warning( f"Failed to close HTTP session: { e }" )
+
+
+async def _read_json( response: aiohttp.ClientResponse ) -> Any:
+    """
+    Parse the response body with orjson, which is much faster than aiohttp's stdlib json.
+    Raises orjson.JSONDecodeError (a ValueError subclass) on malformed bodies.
+    """
+    raw = await response.read()
+    return orjson.loads( raw )
+
+
+def _get_breaker( url: str ) -> Dict[str, Any]:
+    """Get the circuit breaker state for the host of a url"""
+    host = urlsplit( url ).netloc
+    return _breakers.setdefault( host, { "failures": 0, "open_until": 0.0, "trial": False, "last_error": None } )
+
+
+def _record_failure( breaker: Dict[str, Any], error: Exception, is_trial: bool ):
+    """Count a failed request, opening the circuit at the threshold or when the trial request failed"""
+    breaker[ "failures" ] += 1
+    breaker[ "last_error" ] = error
+    if is_trial or breaker[ "failures" ] >= CB_THRESHOLD:
+        breaker[ "open_until" ] = time.monotonic() + CB_COOLDOWN
+        bt.logging.error(
+            f"HTTP circuit opened for { CB_COOLDOWN:.0f}s after { breaker[ 'failures' ] } consecutive failed requests: { error }"
+        )
+
+
+def _reset_breaker( breaker: Dict[str, Any] ):
+    """Close the circuit once the server answers again"""
+    breaker[ "failures" ] = 0
+    breaker[ "open_until" ] = 0.0
+    breaker[ "last_error" ] = None
+
+
+async def _retry_with_backoff(
+    func,
+    *args,
+    max_retries: int = MAX_RETRIES,
+    breaker: Optional[Dict[str, Any]] = None,
+    **kwargs
+):
+    """
+    Execute async function with decorrelated jitter backoff retry logic.
+    Raises HTTPClientError after all retries exhausted, or immediately while the breaker's circuit is open.
     """
     last_error = None
     delay = INITIAL_DELAY
+    is_trial = False
 
-    # Attempt the request up to max_retries times, backing off exponentially on failure
-    for attempt in range( max_retries ):
-        try:
-            return await func( *args, **kwargs )
-        except ( aiohttp.ClientError, asyncio.TimeoutError, ValueError ) as e:
-            # ValueError catches json.JSONDecodeError (its parent class)
-            last_error = e
-            if attempt < max_retries - 1:
-                # Add jitter to prevent thundering herd
-                jitter = uniform( 0, JITTER_MAX )
-                wait_time = min( delay + jitter, MAX_DELAY )
-                bt.logging.warning(
-                    f"HTTP request failed (attempt { attempt + 1 }/{ max_retries }): { e }. "
-                    f"Retrying in { wait_time:.1f}s..."
-                )
-                await asyncio.sleep( wait_time )
-                delay *= BACKOFF_MULTIPLIER
+    # Fail fast while the circuit is open, after the cooldown a single caller goes through as the trial request
+    if breaker is not None and breaker[ "open_until" ]:
+        if time.monotonic() < breaker[ "open_until" ] or breaker[ "trial" ]:
+            raise HTTPClientError( f"Circuit open, skipping request (last error: { breaker[ 'last_error' ] })" )
+        breaker[ "trial" ] = True
+        is_trial = True
+        max_retries = 1
+
+    try:
+        # Attempt the request up to max_retries times, backing off with decorrelated jitter on failure
+        for attempt in range( max_retries ):
+
+            # Stop retrying when another request opened the circuit in the meantime
+            if breaker is not None and not is_trial and time.monotonic() < breaker[ "open_until" ]:
+                raise HTTPClientError( f"Circuit open, skipping retry (last error: { breaker[ 'last_error' ] })" )
+
+            try:
+                result = await func( *args, **kwargs )
+                if breaker is not None:
+                    _reset_breaker( breaker )
+                return result
+            except ( aiohttp.ClientError, asyncio.TimeoutError, ValueError ) as e:
+                # ValueError catches orjson.JSONDecodeError (its parent class)
+                last_error = e
+                if attempt < max_retries - 1:
+                    # Pick the next delay from [INITIAL_DELAY, 3 * previous delay] so that
+                    # validators retrying at the same moment spread out instead of clustering
+                    delay = min( MAX_DELAY, _random.uniform( INITIAL_DELAY, delay * BACKOFF_MULTIPLIER ) )
+                    bt.logging.warning(
+                        f"HTTP request failed (attempt { attempt + 1 }/{ max_retries }): { e }. "
+                        f"Retrying in { delay:.1f}s..."
+                    )
+                    await asyncio.sleep( delay )
+                else:
+                    bt.logging.error(
+                        f"HTTP request failed after { max_retries } attempts: { e }"
+                    )
+
+        # Only connection errors and timeouts mean the server is down, a non-JSON body means it answered
+        if breaker is not None:
+            if isinstance( last_error, ValueError ):
+                _reset_breaker( breaker )
             else:
-                bt.logging.error(
-                    f"HTTP request failed after { max_retries } attempts: { e }"
-                )
+                _record_failure( breaker, last_error, is_trial )
+
+        raise HTTPClientError( f"Request failed after { max_retries } retries: { last_error }" )
 
-    raise HTTPClientError( f"Request failed after { max_retries } retries: { last_error }" )
+    finally:
+        if is_trial:
+            breaker[ "trial" ] = False
 
 
 async def get_json(
     url: str,
     timeout: Optional[float] = None,
-    retries: int = MAX_RETRIES
+    retries: int = MAX_RETRIES,
+    circuit_breaker: bool = False
 ) -> Any:
     """
     Perform GET request and return JSON response.
-    Includes timeout and retry logic.
+    Includes timeout and retry logic, and fails fast while the host's circuit is open when circuit_breaker is set.
     """
     async def _fetch():
-        timeout_config = _get_timeout( timeout )
-        async with aiohttp.ClientSession( timeout=timeout_config ) as session:
-            async with session.get( url ) as response:
-                return await response.json()
+        session = await get_session()
+        async with session.get( url, timeout=get_timeout( timeout ) ) as response:
+            return await _read_json( response )
 
-    return await _retry_with_backoff( _fetch, max_retries=retries )
+    breaker = _get_breaker( url ) if circuit_breaker else None
+    return await _retry_with_backoff( _fetch, max_retries=retries, breaker=breaker )
 
 
 async def post_json(
     url: str,
-    json: Dict[str, Any],
+    json: Optional[Dict[str, Any]] = None,
     timeout: Optional[float] = None,
     retries: int = MAX_RETRIES,
-    headers: Optional[Dict[str, str]] = None
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[bytes] = None,
+    circuit_breaker: bool = False
 ) -> Any:
     """
     Perform POST request with JSON body and return JSON response.
-    Includes timeout and retry logic.
+    Pass an already serialized body as data to skip aiohttp's json encoding.
+    Includes timeout and retry logic, and fails fast while the host's circuit is open when circuit_breaker is set.
     """
+    if data is not None:
+        headers = { **( headers or {} ), "Content-Type": "application/json" }
+
     async def _fetch():
-        timeout_config = _get_timeout( timeout )
-        async with aiohttp.ClientSession( timeout=timeout_config ) as session:
-            async with session.post( url, json=json, headers=headers ) as response:
-                return await response.json()
+        session = await get_session()
+        if data is not None:
+            request = session.post( url, data=data, headers=headers, timeout=get_timeout( timeout ) )
+        else:
+            request = session.post( url, json=json, headers=headers, timeout=get_timeout( timeout ) )
+        async with request as response:
+            return await _read_json( response )
 
-    return await _retry_with_backoff( _fetch, max_retries=retries )
+    breaker = _get_breaker( url ) if circuit_breaker else None
+    return await _retry_with_backoff( _fetch, max_retries=retries, breaker=breaker )
 
 
 async def get_json_no_retry(
@@ -115,11 +260,10 @@ async def get_json_no_retry(
     we want individual failures to return quickly).
     """
     try:
-        timeout_config = _get_timeout( timeout )
-        async with aiohttp.ClientSession( timeout=timeout_config ) as session:
-            async with session.get( url ) as response:
-                return await response.json()
+        session = await get_session()
+        async with session.get( url, timeout=get_timeout( timeout ) ) as response:
+            return await _read_json( response )
     except ( aiohttp.ClientError, asyncio.TimeoutError, ValueError ) as e:
-        # ValueError catches json.JSONDecodeError (its parent class)
+        # ValueError catches orjson.JSONDecodeError (its parent class)
         bt.logging.warning( f"HTTP GET failed: { url } - { e }" )
         return None
@@ -17,9 +17,9 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import time
 import bittensor as bt
 import asyncio
+import orjson
 import numpy as np
 
 from sybil.validator.utils import generate_challenges
@@ -37,13 +37,23 @@ async def forward(self):
         self (:obj:`bittensor.neuron.Neuron`): The neuron object which contains all the necessary state for the validator.
 
     """
-    
-    # Post miner and validator info to the container    
-    await broadcast_neurons(self.metagraph, self.validator_server_url)
-    
+
+    # Post miner and validator info to the container while fetching the mining pool scores,
+    # the two requests are independent so neither has to wait for the other
+    bt.logging.info( f"Getting mining pool scores from { self.validator_server_url }/validator/score/mining_pools" )
+    broadcast_task = asyncio.create_task( broadcast_neurons( self.metagraph, self.validator_server_url ) )
+    score_task = asyncio.create_task( get_json( f"{ self.validator_server_url }/validator/score/mining_pools", circuit_breaker=True ) )
+
+    # return_exceptions keeps a failing request from cancelling the other one
+    broadcast_result, result = await asyncio.gather( broadcast_task, score_task, return_exceptions=True )
+
+    if isinstance( broadcast_result, Exception ):
+        bt.logging.error( f"Failed to broadcast neurons info: { broadcast_result }" )
+
     try:
-        bt.logging.info( f"Getting mining pool scores from { self.validator_server_url }/validator/score/mining_pools" )
-        result = await get_json( f"{ self.validator_server_url }/validator/score/mining_pools" )
+        # Surface a failed score fetch to the handlers below
+        if isinstance( result, Exception ):
+            raise result
 
         # Extract all UIDs from the response
         # Assuming the response is a dict mapping mining_pool_uid to score info
@@ -51,17 +61,18 @@ async def forward(self):
             bt.logging.error( f"Unexpected response format: { result }" )
             all_uids = []
         else:
-            # Parse valid scores from response, skipping malformed entries
-            all_uids = []
-            all_scores = []
-
-            for uid_str, score_info in result.items():
-                if "score" not in score_info:
-                    bt.logging.warning( f"Missing 'score' key for UID { uid_str }: { score_info }" )
-                    continue
-
-                all_uids.append( int( uid_str ) )
-                all_scores.append( float( score_info[ "score" ] ) )
+            # Parse valid scores from response in one pass, skipping malformed entries
+            valid = [
+                ( int( uid_str ), float( score_info[ "score" ] ) )
+                for uid_str, score_info in result.items()
+                if isinstance( score_info, dict ) and "score" in score_info
+            ]
+            all_uids, all_scores = map( list, zip( *valid ) ) if valid else ( [], [] )
+
+            # Warn once for the whole response rather than per malformed entry
+            skipped = len( result ) - len( valid )
+            if skipped:
+                bt.logging.warning( f"Skipped { skipped } mining pool score entries missing a 'score' key" )
 
             bt.logging.info( f"Retrieved { len( all_uids ) } UIDs from mining pool scores response" )
 
@@ -73,7 +84,38 @@ async def forward(self):
     except Exception as e:
         bt.logging.error( f"Failed to get mining pool scores: { e }" )
 
-    time.sleep( 10 )
+    await asyncio.sleep( 10 )
+
+
+def _columns_to_rows(neurons_info):
+    """
+    Expand the columnar broadcast body into the per-neuron objects older containers expect.
+    """
+    block = neurons_info[ "block" ]
+    excluded_uid = neurons_info[ "excluded_uid" ]
+    columns = zip(
+        neurons_info[ "uids" ],
+        neurons_info[ "ips" ],
+        neurons_info[ "validator_trust" ],
+        neurons_info[ "alpha_stake" ].tolist(),
+        neurons_info[ "stake_weight" ].tolist(),
+        neurons_info[ "hotkey" ],
+        neurons_info[ "coldkey" ],
+    )
+    return [
+        {
+            'uid': uid,
+            'ip': ip,
+            'validator_trust': validator_trust,
+            "alpha_stake": alpha_stake,
+            'stake_weight': stake_weight,
+            'block': block,
+            'hotkey': hotkey,
+            'coldkey': coldkey,
+            'excluded': uid == excluded_uid,
+        }
+        for uid, ip, validator_trust, alpha_stake, stake_weight, hotkey, coldkey in columns
+    ]
 
 
 async def broadcast_neurons(metagraph, server_url):
@@ -82,29 +124,45 @@ async def broadcast_neurons(metagraph, server_url):
     """
     bt.logging.info( f"Broadcasting neurons to { server_url }/protocol/broadcast/neurons" )
 
-    neurons_info = []
-    block = int(metagraph.block)
-    for neuron in metagraph.neurons:
-        uid = neuron.uid
-        neurons_info.append({
-            'uid': uid,
-            'ip': metagraph.axons[uid].ip,
-            'validator_trust': neuron.validator_trust,
-            "alpha_stake": float(metagraph.alpha_stake[uid].item()),
-            'stake_weight': float(metagraph.S[uid].item()),
-            'block': block,
-            'hotkey': neuron.hotkey,
-            'coldkey': neuron.coldkey,
-            'excluded': uid == BURN_UID,
-        })
-    bt.logging.info( f"Submitting neurons info: { len( neurons_info ) } neurons" )
+    # Bind metagraph attributes to locals once, they are properties that would be resolved per neuron
+    neurons = metagraph.neurons
+    axons = metagraph.axons
+    uids = [ neuron.uid for neuron in neurons ]
+
+    # Send one array per field instead of one object per neuron, so keys are not repeated N times.
+    # Stake arrays stay numpy and are indexed by uid in one call, orjson serializes them natively
+    neurons_info = {
+        "uids": uids,
+        "ips": [ axons[ uid ].ip for uid in uids ],
+        "validator_trust": [ neuron.validator_trust for neuron in neurons ],
+        "alpha_stake": np.asarray( metagraph.alpha_stake, dtype=np.float64 )[ uids ],
+        "stake_weight": np.asarray( metagraph.S, dtype=np.float64 )[ uids ],
+        "hotkey": [ neuron.hotkey for neuron in neurons ],
+        "coldkey": [ neuron.coldkey for neuron in neurons ],
+        "block": int( metagraph.block ),
+        "excluded_uid": BURN_UID,
+    }
+    bt.logging.info( f"Submitting neurons info: { len( uids ) } neurons" )
     try:
+        # Serialize once with orjson rather than letting aiohttp use the stdlib encoder on every attempt
+        payload = orjson.dumps( neurons_info, option=orjson.OPT_SERIALIZE_NUMPY )
         result = await post_json(
             f"{ server_url }/protocol/broadcast/neurons",
-            json={ "neurons": neurons_info }
+            data=payload,
+            circuit_breaker=True
         )
+
+        # Containers before 1.11.0 find no neurons in the columnar body, resend as one object per neuron
+        if not result.get( "success" ):
+            bt.logging.warning( f"Columnar neuron broadcast not accepted: { result }. Resending as neuron objects" )
+            result = await post_json(
+                f"{ server_url }/protocol/broadcast/neurons",
+                data=orjson.dumps( { "neurons": _columns_to_rows( neurons_info ) } ),
+                circuit_breaker=True
+            )
+
         if result.get( "success" ):
-            bt.logging.info( f"Broadcasted neurons info: { len( neurons_info ) } neurons" )
+            bt.logging.info( f"Broadcasted neurons info: { len( uids ) } neurons" )
         else:
             bt.logging.error( f"Failed to broadcast neurons info: { result }" )
     except HTTPClientError as e:
@@ -1,71 +1,142 @@
 import asyncio
-import aiohttp
 from sybil.protocol import Challenge
-from typing import List
+from typing import List, Optional
 import bittensor as bt
 
-from sybil.utils.http import get_json_no_retry
+from sybil.utils.http import get_json_no_retry, post_json, HTTPClientError, CHALLENGE_TIMEOUT, get_session, get_timeout
+
+# Maximum number of challenge requests in flight against the validator container
+_CHALLENGE_CONCURRENCY = 32
+
+# Whether the validator container answered a readiness probe, cleared again when challenge fetches fail
+_container_ready: bool = False
+_ready_lock = asyncio.Lock()
 
 
 # Fetch a challenge from a given URL (with timeout, no retry for use in asyncio.gather)
 async def fetch( url ):
     return await get_json_no_retry( url )
 
-# Wait until the / endpoint returns a 200 OK response
-async def wait_for_validator_container(validator_server_url: str):
+# Wait until the / endpoint returns a 200 OK response, returns whether the server came up
+async def wait_for_validator_container(validator_server_url: str) -> bool:
     max_retries = 10
     retries = 0
     while True:
 
         if retries >= max_retries:
             bt.logging.error("Validator server not ready after maximum retries. Allowing unhealthy continuation of neuron logic.")
-            return
+            return False
 
         try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(validator_server_url) as response:
-                    if response.status == 200:
-                        bt.logging.info("Validator server is up and running.")
-                        return
+            # HEAD on the shared session, the probe only needs the status code
+            session = await get_session()
+            async with session.head(validator_server_url, allow_redirects=False, timeout=get_timeout(10)) as response:
+                if response.status == 200:
+                    bt.logging.info("Validator server is up and running.")
+                    return True
         except Exception as e:
             bt.logging.error(f"Validator server not ready yet: {e}")
         retries += 1
         await asyncio.sleep(10)  # Wait before retrying
 
 
+# Generate all challenges with a single request, returns None if the bulk request fails
+async def generate_challenges_bulk( miner_uids: List[int], validator_server_url: str ) -> Optional[List[Challenge]]:
+    try:
+        # Single attempt so containers without the route fall back right away, and a long
+        # timeout since the container generates every challenge before answering
+        response = await post_json(
+            f"{ validator_server_url }/protocol/challenge/new_bulk",
+            json={ "miner_uids": miner_uids },
+            timeout=CHALLENGE_TIMEOUT,
+            retries=1
+        )
+    except HTTPClientError as e:
+        bt.logging.warning( f"Bulk challenge request failed: { e }" )
+        return None
+
+    entries = response.get( "challenges" ) if isinstance( response, dict ) else None
+    if not isinstance( entries, list ):
+        bt.logging.warning( f"Unexpected bulk challenge response: { response }" )
+        return None
+
+    # Skip malformed entries, matching the per-miner path
+    return [
+        Challenge( challenge=entry[ "challenge" ], challenge_url=entry[ "challenge_url" ] )
+        for entry in entries
+        if isinstance( entry, dict ) and "challenge" in entry and "challenge_url" in entry
+    ]
+
+
 # Generate one challenge per miner_uid, appending ?miner_uid=<uid> to each request
-async def generate_challenges( miner_uids: List[int], validator_server_url: str ) -> List[Challenge]:
+async def generate_challenges( miner_uids: List[int], validator_server_url: str, use_bulk: bool = True ) -> List[Challenge]:
+    global _container_ready
     try:
-        # Ensure the validator server is ready before making requests
-        await wait_for_validator_container( validator_server_url )
+        # Ensure the validator server is ready before making requests, only probing until it has answered once
+        if not _container_ready:
+            async with _ready_lock:
+                if not _container_ready:
+                    _container_ready = await wait_for_validator_container( validator_server_url )
+
+        # Prefer one bulk request, falling back to per-miner requests if it fails
+        if use_bulk:
+            challenges = await generate_challenges_bulk( miner_uids, validator_server_url )
+            if challenges is not None:
+                return challenges
+            bt.logging.warning( "Falling back to per-miner challenge requests" )
 
-        # Create fetch tasks for each miner
-        tasks = []
-        for uid in miner_uids:
-            bt.logging.info( f"Generating challenge for miner uid: { uid }" )
-            url = f"{ validator_server_url }/challenge/new?miner_uid={ uid }"
-            tasks.append( fetch( url ) )
+        # Cap concurrent requests so large miner sets don't exhaust sockets on the container
+        sem = asyncio.Semaphore( _CHALLENGE_CONCURRENCY )
 
-        # Fetch all challenges concurrently
-        responses = await asyncio.gather( *tasks )
+        # The deadline applies per fetch and only starts once it holds a slot, so queued miners are never cut off
+        async def _guarded( url ):
+            async with sem:
+                try:
+                    return await asyncio.wait_for( fetch( url ), CHALLENGE_TIMEOUT )
+                except asyncio.TimeoutError:
+                    bt.logging.warning( f"Challenge fetch timed out after { CHALLENGE_TIMEOUT }s: { url }" )
+                    return None
 
-        # Filter out None responses (from timeouts) and build challenges
+        # Create fetch tasks for each miner, logging once for the batch rather than per uid
+        bt.logging.info( f"Generating challenges for { len( miner_uids ) } miner uids" )
+        tasks = [
+            asyncio.ensure_future( _guarded( f"{ validator_server_url }/challenge/new?miner_uid={ uid }" ) )
+            for uid in miner_uids
+        ]
+
+        # Build each challenge as soon as its response lands instead of waiting for the slowest miner
         challenges = []
-        for response in responses:
-            if response is None:
-                bt.logging.warning( "Skipping challenge due to failed fetch" )
-                continue
-
-            # Validate response has required fields
-            if "challenge" not in response or "challenge_url" not in response:
-                bt.logging.warning( f"Skipping malformed challenge response: { response }" )
-                continue
-
-            challenges.append( Challenge(
-                challenge=response[ "challenge" ],
-                challenge_url=response[ "challenge_url" ]
-            ) )
+        try:
+            for next_response in asyncio.as_completed( tasks ):
+
+                # One failing miner must not stop the others from being processed
+                try:
+                    response = await next_response
+                except Exception as e:
+                    bt.logging.warning( f"Challenge fetch raised: { e }" )
+                    response = None
+
+                # Skip None responses (from timeouts)
+                if response is None:
+                    bt.logging.warning( "Skipping challenge due to failed fetch" )
+                    # Re-probe the container on the next round
+                    _container_ready = False
+                    continue
+
+                # Validate response has required fields
+                if "challenge" not in response or "challenge_url" not in response:
+                    bt.logging.warning( f"Skipping malformed challenge response: { response }" )
+                    continue
+
+                challenges.append( Challenge(
+                    challenge=response[ "challenge" ],
+                    challenge_url=response[ "challenge_url" ]
+                ) )
+
+        finally:
+            # Don't leave fetches running if challenge building is aborted
+            for task in tasks:
+                task.cancel()
 
         return challenges
     except Exception as e: